@@ -4,6 +4,7 @@ BlueprintCompiler - NORP-005 Reference Implementation
 Implements:
 - NORP-005: Deterministic Topological Ordering (Kahn's algorithm)
 - NORP-004: Cycle detection via topological sort
+- Branch-aware plans (subgraphs guarded by `conditional` outcomes)
 
 License: MIT
 Copyright: 2026 NeuraScope CONVERWAY
@@ -11,6 +12,7 @@ Copyright: 2026 NeuraScope CONVERWAY
 
 from typing import List, Dict, Any
 from execution_plan import ExecutionPlan
+from branch_analysis import BranchAnalyzer
 
 
 class BlueprintCompiler:
@@ -45,14 +47,22 @@ class BlueprintCompiler:
         # 3. Detect parallelizable groups
         parallel_groups = self._detect_parallel_groups(graph)
 
-        # 4. Estimate duration
-        estimated_duration = self._estimate_duration(nodes)
+        # 4. Detect conditional branches
+        analyzer = BranchAnalyzer()
+        branches = analyzer.detect_branches(nodes)
+        run_conditions = analyzer.get_run_conditions(nodes)
+
+        # 5. Estimate duration (min / max / expected across branches)
+        duration_estimate = self._estimate_duration(nodes, branches)
 
         return ExecutionPlan(
             nodes=nodes,
             execution_order=execution_order,
             parallel_groups=parallel_groups,
-            estimated_duration_ms=estimated_duration
+            estimated_duration_ms=duration_estimate['max'],
+            branches=branches,
+            duration_estimate=duration_estimate,
+            run_conditions=run_conditions
         )
 
     def _topological_sort(self, nodes: List[dict], graph: Dict[str, List[str]]) -> List[str]:
@@ -201,15 +211,16 @@ class BlueprintCompiler:
 
         return levels
 
-    def _estimate_duration(self, nodes: List[dict]) -> int:
+    def _estimate_duration(self, nodes: List[dict], branches: List[dict]) -> Dict[str, int]:
         """
-        Estimate total execution duration
+        Estimate total execution duration across conditional branches
 
         Args:
             nodes: List of nodes
+            branches: Branch metadata
 
         Returns:
-            Duration in milliseconds
+            {'min': int, 'max': int, 'expected': int} in milliseconds
         """
         duration_by_type = {
             'datasource': 200,
@@ -220,9 +231,10 @@ class BlueprintCompiler:
             'output': 50,
         }
 
-        total_duration = sum(
-            duration_by_type.get(node.get('type', 'unknown'), 100)
-            for node in nodes
+        estimate = BranchAnalyzer().estimate_range(
+            nodes,
+            branches,
+            lambda node: duration_by_type.get(node.get('type', 'unknown'), 100)
         )
 
-        return total_duration
+        return {key: int(round(value)) for key, value in estimate.items()}
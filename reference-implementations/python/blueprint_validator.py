@@ -4,7 +4,7 @@ BlueprintValidator - NORP-001 and NORP-004 Reference Implementation
 Implements:
 - NORP-001: Pre-Execution Validation Pipeline (Structural Validation stage)
 - NORP-004: Cycle Detection (DFS algorithm O(V+E))
-- NORP-007: Cost Estimation
+- NORP-007: Cost Estimation (min / max / expected across conditional branches)
 
 License: MIT
 Copyright: 2026 NeuraScope CONVERWAY
@@ -12,6 +12,7 @@ Copyright: 2026 NeuraScope CONVERWAY
 
 from typing import Dict, List, Set, Callable, Optional
 from validation_result import ValidationResult
+from branch_analysis import BranchAnalyzer
 
 
 class BlueprintValidator:
@@ -61,14 +62,19 @@ class BlueprintValidator:
                             f"Node '{node_id}' depends on non-existent node '{dep_id}'"
                         )
 
-        # 4. Validate resources (if validator provided)
+        # 4. Validate conditional branches
+        errors.extend(self._validate_branches(workflow['nodes']))
+
+        # 5. Validate resources (if validator provided)
         if resource_validator:
             for node in workflow['nodes']:
                 resource_errors = resource_validator(node)
                 errors.extend(resource_errors)
 
-        # 5. Estimate cost (NORP-007)
-        estimated_cost = self._estimate_cost(workflow['nodes'])
+        # 6. Estimate cost (NORP-007)
+        # Conservative: the most expensive branch is the reference cost
+        cost_estimate = self._estimate_cost(workflow['nodes'])
+        estimated_cost = cost_estimate['max']
 
         if estimated_cost > 100:
             warnings.append(
@@ -80,9 +86,59 @@ class BlueprintValidator:
             valid=len(errors) == 0,
             errors=errors,
             warnings=warnings,
-            estimated_cost=estimated_cost
+            estimated_cost=estimated_cost,
+            cost_estimate=cost_estimate
         )
 
+    def _validate_branches(self, nodes: List[dict]) -> List[str]:
+        """
+        Validate conditional branch declarations
+
+        Each outcome entry node must exist and depend on its conditional.
+
+        Args:
+            nodes: List of nodes
+
+        Returns:
+            List of error messages
+        """
+        errors = []
+        nodes_by_id = {node.get('id'): node for node in nodes}
+
+        for node in nodes:
+            if node.get('type') != 'conditional':
+                continue
+
+            node_id = node.get('id', 'unknown')
+            config = node.get('config', {})
+            branches = config.get('branches', {}) if isinstance(config, dict) else None
+
+            if not isinstance(branches, dict) or not all(
+                isinstance(entries, list) for entries in branches.values()
+            ):
+                errors.append(
+                    f"Conditional '{node_id}' branches must map each outcome "
+                    "to a list of node IDs"
+                )
+                continue
+
+            for outcome, entries in branches.items():
+                for entry_id in entries:
+                    entry = nodes_by_id.get(entry_id)
+
+                    if entry is None:
+                        errors.append(
+                            f"Conditional '{node_id}' outcome '{outcome}' "
+                            f"references non-existent node '{entry_id}'"
+                        )
+                    elif node_id not in entry.get('depends_on', []):
+                        errors.append(
+                            f"Conditional '{node_id}' outcome '{outcome}' entry "
+                            f"'{entry_id}' must depend on '{node_id}'"
+                        )
+
+        return errors
+
     def _detect_cycles(self, nodes: List[dict]) -> bool:
         """
         Detect cycles using DFS (NORP-004)
@@ -179,40 +235,51 @@ class BlueprintValidator:
         """Check if node exists"""
         return any(node.get('id') == node_id for node in nodes)
 
-    def _estimate_cost(self, nodes: List[dict]) -> float:
+    def _estimate_cost(self, nodes: List[dict]) -> Dict[str, float]:
         """
-        Estimate workflow cost (NORP-007)
+        Estimate workflow cost across conditional branches (NORP-007)
 
         Args:
             nodes: List of nodes
 
         Returns:
-            Estimated cost in USD
+            {'min': float, 'max': float, 'expected': float} in USD
         """
-        total_cost = 0.0
+        analyzer = BranchAnalyzer()
+        branches = analyzer.detect_branches(nodes)
+        estimate = analyzer.estimate_range(nodes, branches, self._estimate_node_cost)
 
-        for node in nodes:
-            if node.get('type') == 'llm_call':
-                config = node.get('config', {})
-                max_tokens = config.get('max_tokens', 1000)
-                model = config.get('model', 'gpt-3.5-turbo')
+        # NORP-007: Conservative estimation (30% margin)
+        return {key: round(value * 1.3, 4) for key, value in estimate.items()}
 
-                pricing = self._get_model_pricing(model)
+    def _estimate_node_cost(self, node: dict) -> float:
+        """
+        Estimate single node cost (NORP-007)
 
-                # NORP-007: Token estimation (chars / 4 for English)
-                prompt = config.get('prompt', '')
-                input_tokens = len(prompt) / 4
+        Args:
+            node: Node definition
 
-                # NORP-007: Cost formula
-                cost_per_execution = (
-                    (input_tokens / 1000 * pricing['input']) +
-                    (max_tokens / 1000 * pricing['output'])
-                )
+        Returns:
+            Estimated cost in USD (0 for non-billable nodes)
+        """
+        if node.get('type') != 'llm_call':
+            return 0.0
 
-                total_cost += cost_per_execution
+        config = node.get('config', {})
+        max_tokens = config.get('max_tokens', 1000)
+        model = config.get('model', 'gpt-3.5-turbo')
 
-        # NORP-007: Conservative estimation (30% margin)
-        return round(total_cost * 1.3, 4)
+        pricing = self._get_model_pricing(model)
+
+        # NORP-007: Token estimation (chars / 4 for English)
+        prompt = config.get('prompt', '')
+        input_tokens = len(prompt) / 4
+
+        # NORP-007: Cost formula
+        return (
+            (input_tokens / 1000 * pricing['input']) +
+            (max_tokens / 1000 * pricing['output'])
+        )
 
     def _get_model_pricing(self, model: str) -> dict:
         """
@@ -0,0 +1,374 @@
+"""
+BranchAnalyzer - Conditional branch analysis for plans and estimates
+
+Implements:
+- Run conditions: when each node runs, given `conditional` outcomes
+- Branch metadata: subgraph guarded by each outcome of a `conditional` node
+- Min / max / expected estimates across branches (NORP-005, NORP-007)
+
+A conditional node declares its outcomes as entry nodes:
+
+    {'id': 'check', 'type': 'conditional',
+     'config': {'branches': {'true': ['approve'], 'false': ['reject']}}}
+
+The run condition of a node is a disjunction of terms, each term a set of
+(conditional, outcome) pairs that must all be taken (an empty term is
+always true). An outcome entry requires its conditional's condition plus
+its own pair. A node requires every dependency, except dependencies that
+are alternatives to the one being considered (all their terms take a
+different outcome of some conditional): a join after branches runs when
+any of its branches is taken, but never when none of them is, and
+upstream or unrelated dependencies never keep an untaken branch alive.
+
+    j depends on x (c1:a AND c2:t) and bb (c1:b)
+    → run condition: (c1:b) OR (c1:a AND c2:t)
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+from itertools import product
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+Term = FrozenSet[Tuple[str, str]]
+Condition = FrozenSet[Term]
+
+ALWAYS: Condition = frozenset({frozenset()})
+
+
+class BranchAnalyzer:
+    """
+    Analyze conditional branches of a workflow
+    """
+
+    # Above this number of outcome combinations, estimates fall back to bounds
+    MAX_SCENARIOS = 4096
+
+    def detect_branches(self, nodes: List[dict]) -> List[dict]:
+        """
+        Detect subgraphs guarded by each conditional outcome
+
+        A node is guarded by an outcome when every term of its run condition
+        requires that outcome.
+
+        Args:
+            nodes: List of nodes
+
+        Returns:
+            [{'conditional': 'check', 'outcomes': {'true': ['approve', ...]}}]
+            sorted by conditional ID (deterministic)
+        """
+        conditions = self.compute_conditions(nodes)
+        branches = []
+
+        for node in nodes:
+            if node.get('type') != 'conditional':
+                continue
+
+            conditional_id = node.get('id')
+
+            branches.append({
+                'conditional': conditional_id,
+                'outcomes': {
+                    outcome: sorted(
+                        node_id
+                        for node_id, condition in conditions.items()
+                        if condition and all(
+                            (conditional_id, outcome) in term for term in condition
+                        )
+                    )
+                    for outcome in sorted(self.get_outcomes(node))
+                }
+            })
+
+        return sorted(branches, key=lambda b: str(b['conditional']))
+
+    def get_outcomes(self, node: dict) -> Dict[str, List[str]]:
+        """
+        Get valid branch declarations of a conditional node
+
+        Returns:
+            {'outcome': ['entry_id', ...]}, empty if config.branches is not
+            an object mapping outcomes to lists of node IDs
+        """
+        config = node.get('config')
+        branches = config.get('branches') if isinstance(config, dict) else None
+
+        if not isinstance(branches, dict):
+            return {}
+
+        if not all(isinstance(entries, list) for entries in branches.values()):
+            return {}
+
+        return branches
+
+    def compute_conditions(self, nodes: List[dict]) -> Dict[str, Condition]:
+        """
+        Compute the run condition of each node
+
+        Args:
+            nodes: List of nodes
+
+        Returns:
+            {'node_id': frozenset({frozenset({('conditional_id', 'outcome'), ...}), ...})}
+        """
+        entry_of: Dict[str, List[Tuple[str, str]]] = {}
+
+        for node in nodes:
+            if node.get('type') != 'conditional':
+                continue
+
+            for outcome, entries in self.get_outcomes(node).items():
+                for entry_id in entries:
+                    entry_of.setdefault(entry_id, []).append((node.get('id'), outcome))
+
+        conditions: Dict[str, Condition] = {}
+
+        for node_id, dependencies in self._topological_order(nodes):
+            requirements = [
+                conditions.get(dep_id, ALWAYS)
+                for dep_id in dependencies
+            ]
+
+            for conditional_id, outcome in entry_of.get(node_id, []):
+                requirements.append(frozenset(
+                    term | {(conditional_id, outcome)}
+                    for term in conditions.get(conditional_id, ALWAYS)
+                ))
+
+            conditions[node_id] = self._combine(requirements)
+
+        return conditions
+
+    def get_run_conditions(self, nodes: List[dict]) -> Dict[str, List[List[List[str]]]]:
+        """
+        Get run conditions of conditional nodes in serializable form
+
+        Args:
+            nodes: List of nodes
+
+        Returns:
+            {'node_id': [[['conditional_id', 'outcome'], ...], ...]} (one list
+            per term, sorted); nodes that always run are left out
+        """
+        return {
+            node_id: sorted(
+                sorted([conditional_id, outcome] for conditional_id, outcome in term)
+                for term in condition
+            )
+            for node_id, condition in sorted(self.compute_conditions(nodes).items())
+            if condition != ALWAYS
+        }
+
+    def is_live(self, condition: Condition, decisions: Dict[str, str]) -> bool:
+        """Check if a run condition holds once all reachable conditionals are decided"""
+        return any(
+            all(decisions.get(conditional_id) == outcome for conditional_id, outcome in term)
+            for term in condition
+        )
+
+    def estimate_range(
+        self,
+        nodes: List[dict],
+        branches: List[dict],
+        value_of: Callable[[dict], float]
+    ) -> Dict[str, float]:
+        """
+        Estimate min / max / expected total across branch outcomes
+
+        Every combination of outcomes of the conditionals that actually run
+        is enumerated, and a node counts when its run condition holds (same
+        rule as pruning). Outcomes are weighted equally, so a node's weight in
+        the expected value is the product of the probabilities of its pairs.
+
+        Beyond MAX_SCENARIOS combinations, expected stays exact (per-node
+        probability) while min / max fall back to bounds: nodes that always
+        run, nodes that can run.
+
+        Args:
+            nodes: List of nodes
+            branches: Branch metadata from detect_branches()
+            value_of: Per-node estimate (duration, cost...)
+
+        Returns:
+            {'min': float, 'max': float, 'expected': float}
+        """
+        conditions = self.compute_conditions(nodes)
+        outcomes_of = {b['conditional']: list(b['outcomes']) for b in branches}
+        values = [(conditions.get(node.get('id'), ALWAYS), value_of(node)) for node in nodes]
+
+        conditionals = [
+            node_id
+            for node_id, _ in self._topological_order(nodes)
+            if outcomes_of.get(node_id)
+        ]
+        scenarios = self._enumerate_scenarios(conditionals, conditions, outcomes_of)
+
+        if scenarios is not None:
+            totals = [
+                (sum(value for condition, value in values if self.is_live(condition, decisions)), weight)
+                for decisions, weight in scenarios
+            ]
+
+            return {
+                'min': min(total for total, _ in totals),
+                'max': max(total for total, _ in totals),
+                'expected': sum(total * weight for total, weight in totals),
+            }
+
+        probabilities = [
+            (self._probability(condition, outcomes_of), value)
+            for condition, value in values
+        ]
+
+        return {
+            'min': sum(value for p, value in probabilities if p >= 1.0),
+            'max': sum(value for p, value in probabilities if p > 0.0),
+            'expected': sum(p * value for p, value in probabilities),
+        }
+
+    def _enumerate_scenarios(
+        self,
+        conditionals: List[str],
+        conditions: Dict[str, Condition],
+        outcomes_of: Dict[str, List[str]]
+    ) -> Optional[List[Tuple[Dict[str, str], float]]]:
+        """
+        Enumerate outcome decisions of the conditionals that run
+
+        Conditionals are decided in topological order; one whose run
+        condition is falsified by earlier decisions never runs.
+
+        Returns:
+            [(decisions, probability)], None if above MAX_SCENARIOS
+        """
+        scenarios: List[Tuple[Dict[str, str], float]] = [({}, 1.0)]
+
+        for conditional_id in conditionals:
+            condition = conditions.get(conditional_id, frozenset())
+            expanded = []
+
+            for decisions, weight in scenarios:
+                if not self.is_live(condition, decisions):
+                    expanded.append((decisions, weight))
+                    continue
+
+                outcomes = outcomes_of[conditional_id]
+                for outcome in outcomes:
+                    expanded.append((
+                        {**decisions, conditional_id: outcome},
+                        weight / len(outcomes)
+                    ))
+
+            if len(expanded) > self.MAX_SCENARIOS:
+                return None
+
+            scenarios = expanded
+
+        return scenarios
+
+    def _probability(self, condition: Condition, outcomes_of: Dict[str, List[str]]) -> float:
+        """Probability that a run condition holds (independent, equal outcomes)"""
+        # Terms on a conditional without outcomes never hold
+        condition = frozenset(
+            term for term in condition
+            if all(outcomes_of.get(c) for c, _ in term)
+        )
+        support = sorted({c for term in condition for c, _ in term}, key=str)
+        choices = [outcomes_of[c] for c in support]
+
+        weight = 1.0
+        for options in choices:
+            weight /= len(options)
+
+        return sum(
+            weight
+            for assignment in product(*choices)
+            if self.is_live(condition, dict(zip(support, assignment)))
+        )
+
+    def _topological_order(self, nodes: List[dict]) -> List[Tuple[str, List[str]]]:
+        """
+        Kahn's algorithm over known dependencies (NORP-005)
+
+        Nodes on a cycle (reported by NORP-004 validation) are left out.
+
+        Returns:
+            [('node_id', ['dep_id', ...])] in topological order
+        """
+        dependencies = {}
+
+        for node in nodes:
+            dependencies[node.get('id')] = node.get('depends_on', [])
+
+        for node_id in dependencies:
+            dependencies[node_id] = [d for d in dependencies[node_id] if d in dependencies]
+
+        in_degree = {node_id: len(deps) for node_id, deps in dependencies.items()}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in dependencies}
+
+        for node_id, deps in dependencies.items():
+            for dep_id in deps:
+                dependents[dep_id].append(node_id)
+
+        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        order = []
+
+        while queue:
+            current = queue.pop(0)
+            order.append((current, dependencies[current]))
+
+            for dependent_id in dependents[current]:
+                in_degree[dependent_id] -= 1
+
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+
+        return order
+
+    def _combine(self, requirements: List[Condition]) -> Condition:
+        """
+        Combine dependency conditions into a node condition
+
+        For each term of each requirement, AND it with the compatible terms
+        of every other requirement; a requirement whose terms all conflict
+        with it is an alternative branch and is skipped.
+        """
+        if not requirements:
+            return ALWAYS
+
+        terms: Set[Term] = set()
+
+        for index, requirement in enumerate(requirements):
+            for term in requirement:
+                partial: Set[Term] = {term}
+
+                for other_index, other in enumerate(requirements):
+                    if other_index == index:
+                        continue
+
+                    compatible = [t for t in other if not self._conflicts(term, t)]
+
+                    if not compatible:
+                        continue
+
+                    partial = {
+                        p | t
+                        for p in partial
+                        for t in compatible
+                        if not self._conflicts(p, t)
+                    }
+
+                terms.update(partial)
+
+        # Absorption: a term implied by a smaller one is redundant
+        return frozenset(
+            term for term in terms
+            if not any(other < term for other in terms)
+        )
+
+    def _conflicts(self, first: Term, second: Term) -> bool:
+        """Check if two terms take different outcomes of the same conditional"""
+        taken = dict(first)
+        return any(c in taken and taken[c] != outcome for c, outcome in second)
@@ -1,7 +1,8 @@
 """
 NORP Python Reference Implementation - Usage Example
 
-Demonstrates NORP-001, 004, 005, 007 compliance
+Demonstrates NORP-001, 004, 005, 007 compliance, branch-aware plans,
+per-server rate limiting and tenant-scoped node memoization
 
 License: MIT
 Copyright: 2026 NeuraScope CONVERWAY
@@ -9,6 +10,8 @@ Copyright: 2026 NeuraScope CONVERWAY
 
 from blueprint_validator import BlueprintValidator
 from blueprint_compiler import BlueprintCompiler
+from rate_limiter import LlmRateLimiter
+from node_memo import NodeMemoCache
 
 # Example workflow (diamond pattern)
 workflow = {
@@ -23,6 +26,7 @@ workflow = {
             'id': 'summarize',
             'type': 'llm_call',
             'config': {
+                'llm_server_id': 1,
                 'model': 'gpt-4-turbo',
                 'prompt': 'Summarize this text...',
                 'max_tokens': 500
@@ -33,6 +37,7 @@ workflow = {
             'id': 'classify',
             'type': 'llm_call',
             'config': {
+                'llm_server_id': 1,
                 'model': 'claude-3-haiku',
                 'prompt': 'Classify sentiment...',
                 'max_tokens': 200
@@ -136,4 +141,93 @@ if plan1.execution_order == plan2.execution_order:
 else:
     print("❌ Non-deterministic: Orders differ")
 
+# ═══════════════════════════════════════════════════════════
+# Branch-Aware Plans: conditional nodes
+# ═══════════════════════════════════════════════════════════
+
+print("\n═══ Branch-Aware Plans: Conditional Nodes ═══\n")
+
+branching_workflow = {
+    'name': 'Moderation Workflow',
+    'nodes': [
+        {'id': 'extract', 'type': 'datasource', 'depends_on': []},
+        {
+            'id': 'is_flagged',
+            'type': 'conditional',
+            'config': {'branches': {'true': ['review'], 'false': ['auto_publish']}},
+            'depends_on': ['extract']
+        },
+        {
+            'id': 'review',
+            'type': 'llm_call',
+            'config': {'model': 'gpt-4-turbo', 'prompt': 'Review...', 'max_tokens': 800},
+            'depends_on': ['is_flagged']
+        },
+        {'id': 'auto_publish', 'type': 'custom_code', 'depends_on': ['is_flagged']},
+        {'id': 'notify', 'type': 'output', 'depends_on': ['review', 'auto_publish']}
+    ]
+}
+
+branch_result = validator.validate(branching_workflow)
+branch_plan = compiler.compile(branching_workflow)
+
+print(f"Cost (min/expected/max): ${branch_result.cost_estimate['min']:.4f} / "
+      f"${branch_result.cost_estimate['expected']:.4f} / "
+      f"${branch_result.cost_estimate['max']:.4f}")
+print(f"Duration (min/expected/max): {branch_plan.duration_estimate['min']}ms / "
+      f"{branch_plan.duration_estimate['expected']}ms / "
+      f"{branch_plan.duration_estimate['max']}ms")
+
+decisions = {'is_flagged': 'false'}
+print(f"Outcome is_flagged=false → pruned: "
+      f"{', '.join(branch_plan.get_pruned_nodes(decisions))}")
+print(f"Active order: {' → '.join(branch_plan.get_active_order(decisions))}")
+
+# ═══════════════════════════════════════════════════════════
+# Rate Limiting: llm_call execution per llm_server_id + model
+# ═══════════════════════════════════════════════════════════
+
+print("\n═══ Rate Limiting: llm_call Execution ═══\n")
+
+limiter = LlmRateLimiter(server_limits={
+    1: {'requests_per_second': 2.0, 'initial_concurrency': 2}
+})
+
+for node_id in execution_plan.execution_order:
+    node = next(n for n in workflow['nodes'] if n['id'] == node_id)
+    permit = limiter.acquire(node)
+    # Simulated provider response (429 = throttled → concurrency halved)
+    limiter.release(permit, status_code=429 if node_id == 'classify' else 200)
+
+for server_id, metrics in limiter.get_metrics().items():
+    print(f"  Server {server_id}: {metrics['requests']} requests, "
+          f"{metrics['throttled']} throttled, "
+          f"concurrency {metrics['concurrency_limit']}, "
+          f"avg wait {metrics['queue_wait_avg_ms']}ms")
+
+    for model, model_metrics in metrics['models'].items():
+        print(f"    {model}: {model_metrics['requests']} requests, "
+              f"{model_metrics['throttled']} throttled")
+
+# ═══════════════════════════════════════════════════════════
+# NORP-002 + NORP-006: Tenant-Scoped Node Memoization
+# ═══════════════════════════════════════════════════════════
+
+print("\n═══ NORP-002 + NORP-006: Tenant-Scoped Memoization ═══\n")
+
+memo = NodeMemoCache(pure_node_types=['datasource', 'custom_code'], ttl_seconds=60)
+extract_node = workflow['nodes'][0]
+
+# Same inputs: second execution of tenant 'acme' reuses, 'globex' does not
+for tenant_id in ['acme', 'acme', 'globex']:
+    memo.get_or_compute(tenant_id, extract_node, {'doc_id': 42}, lambda: {'text': '...'})
+
+# Explicit bypass
+memo.get_or_compute('acme', extract_node, {'doc_id': 42}, lambda: {'text': '...'}, bypass=True)
+
+stats = memo.get_stats()
+print(f"Hits: {stats['hits']}, Misses: {stats['misses']}, Bypassed: {stats['bypassed']}")
+print(f"Tenants: {stats['tenants']}, Entries: {stats['entries']}")
+print(f"NORP-008 declaration: {memo.get_interface_declaration()}")
+
 print("\n═══ NORP Compliance Verified ═══")
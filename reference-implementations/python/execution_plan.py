@@ -4,13 +4,15 @@ ExecutionPlan - Immutable DTO for compiled execution plan
 NORP Compliance:
 - NORP-003: Immutable DTO (frozen dataclass)
 - NORP-005: Deterministic execution order + parallel groups
+- Branch metadata: subgraphs guarded by `conditional` outcomes
+- Run conditions: outcomes each node needs (pruning)
 
 License: MIT
 Copyright: 2026 NeuraScope CONVERWAY
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Set
 
 
 @dataclass(frozen=True)
@@ -22,6 +24,9 @@ class ExecutionPlan:
     execution_order: List[str]
     parallel_groups: List[Dict[str, Any]]
     estimated_duration_ms: int
+    branches: List[Dict[str, Any]] = field(default_factory=list)
+    duration_estimate: Dict[str, int] = field(default_factory=dict)
+    run_conditions: Dict[str, List[List[List[str]]]] = field(default_factory=dict)
 
     def get_level(self, level: int) -> List[str]:
         """Get nodes at specific dependency level"""
@@ -41,6 +46,42 @@ class ExecutionPlan:
         """Get total number of levels in DAG"""
         return len(self.parallel_groups)
 
+    def get_pruned_nodes(self, decisions: Dict[str, str]) -> List[str]:
+        """
+        Get nodes an executor must skip given conditional outcomes
+
+        A node is pruned when every term of its run condition takes a
+        different outcome of a decided conditional: it needs a branch that
+        was not taken. Joins reachable from the taken branch keep a
+        satisfiable term and keep running; entries of a pruned conditional
+        include the condition that pruned it, so they are pruned too.
+        Nodes without run condition always run.
+
+        Args:
+            decisions: {'conditional_id': 'taken_outcome'} resolved so far
+
+        Returns:
+            Pruned node IDs, in execution order
+        """
+        pruned: Set[str] = set()
+
+        for node_id, terms in self.run_conditions.items():
+            if all(
+                any(
+                    conditional_id in decisions and decisions[conditional_id] != outcome
+                    for conditional_id, outcome in term
+                )
+                for term in terms
+            ):
+                pruned.add(node_id)
+
+        return [node_id for node_id in self.execution_order if node_id in pruned]
+
+    def get_active_order(self, decisions: Dict[str, str]) -> List[str]:
+        """Get execution order without pruned nodes"""
+        pruned = set(self.get_pruned_nodes(decisions))
+        return [node_id for node_id in self.execution_order if node_id not in pruned]
+
     def get_stats(self) -> dict:
         """Get execution plan statistics"""
         parallelizable_count = sum(
@@ -53,5 +94,7 @@ class ExecutionPlan:
             'total_nodes': len(self.nodes),
             'levels': self.get_levels_count(),
             'parallelizable_nodes': parallelizable_count,
-            'estimated_duration_ms': self.estimated_duration_ms
+            'estimated_duration_ms': self.estimated_duration_ms,
+            'conditional_nodes': len(self.branches),
+            'duration_estimate_ms': self.duration_estimate
         }
@@ -0,0 +1,275 @@
+"""
+NodeMemoCache - Tenant-scoped memoization of deterministic node results
+
+Implements:
+- Opt-in memoization for node types declared pure (e.g. datasource, custom_code)
+- Canonical SHA-256 key over node type, config and resolved inputs
+- NORP-002: Keys always namespaced by tenant_id, storage partitioned per tenant
+- NORP-006: Cross-execution cache declared in the NORP-008 interface
+- TTL expiry, per-tenant LRU eviction and a global bound on tenant partitions
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+
+class NodeMemoCache:
+    """
+    Cross-execution memo layer, isolated per tenant
+
+    Usage (executor side):
+        result = memo.get_or_compute(
+            context.tenant_id, node, resolved_inputs,
+            lambda: run_node(node, resolved_inputs)
+        )
+
+    A node opts out with config 'memoize': false, a call with bypass=True.
+    """
+
+    def __init__(
+        self,
+        pure_node_types: List[str],
+        ttl_seconds: float = 300,
+        max_entries_per_tenant: int = 1000,
+        max_tenants: int = 100
+    ):
+        """
+        Args:
+            pure_node_types: Node types whose result depends only on config + inputs
+            ttl_seconds: Entry lifetime
+            max_entries_per_tenant: LRU bound of each tenant partition
+            max_tenants: LRU bound on tenant partitions (global size bound)
+        """
+        self.pure_node_types = sorted(set(pure_node_types))
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_tenant = max_entries_per_tenant
+        self.max_tenants = max_tenants
+
+        self._lock = threading.Lock()
+        self._partitions: OrderedDict = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'bypassed': 0,
+            'not_memoizable': 0,
+            'evictions': 0,
+            'expirations': 0,
+        }
+
+    def is_memoizable(self, node: dict) -> bool:
+        """Check if node type is declared pure and node did not opt out"""
+        if node.get('type') not in self.pure_node_types:
+            return False
+
+        return node.get('config', {}).get('memoize', True) is not False
+
+    def make_key(self, tenant_id: str, node: dict, inputs: Dict[str, Any]) -> str:
+        """
+        Build tenant-scoped memo key (NORP-002)
+
+        Only JSON-native values are accepted, so that the canonical form is
+        injective: tuples (encoded like lists) and non-string dict keys
+        (encoded like strings) would collide with other inputs.
+
+        Args:
+            tenant_id: Tenant owning the execution
+            node: Node definition
+            inputs: Resolved node inputs
+
+        Returns:
+            'tenant:{tenant_id}:node:{sha256}'
+
+        Raises:
+            ValueError: If tenant_id is missing
+            TypeError: If config or inputs are not JSON-native values
+        """
+        if not tenant_id:
+            raise ValueError('tenant_id required for node memoization (NORP-002)')
+
+        payload = {
+            'type': node.get('type'),
+            'config': node.get('config', {}),
+            'inputs': inputs,
+        }
+        self._check_canonical(payload)
+
+        # Canonical form: sorted keys, no whitespace (node ID excluded)
+        canonical = json.dumps(
+            payload,
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False
+        )
+
+        digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+        return f'tenant:{tenant_id}:node:{digest}'
+
+    def get_or_compute(
+        self,
+        tenant_id: str,
+        node: dict,
+        inputs: Dict[str, Any],
+        compute: Callable[[], Any],
+        bypass: bool = False
+    ) -> Any:
+        """
+        Return memoized node result or compute and store it
+
+        Args:
+            tenant_id: Tenant owning the execution
+            node: Node definition
+            inputs: Resolved node inputs
+            compute: Callback executing the node
+            bypass: Skip the cache (neither read nor written)
+
+        Returns:
+            Node result (a private copy, never the cached instance)
+        """
+        if not tenant_id:
+            raise ValueError('tenant_id required for node memoization (NORP-002)')
+
+        if bypass:
+            self._count('bypassed')
+            return compute()
+
+        if not self.is_memoizable(node):
+            self._count('not_memoizable')
+            return compute()
+
+        try:
+            key = self.make_key(tenant_id, node, inputs)
+        except TypeError:
+            # Non-canonical config or inputs: cannot be keyed safely
+            self._count('not_memoizable')
+            return compute()
+
+        with self._lock:
+            partition = self._partitions.get(tenant_id)
+            entry = partition.get(key) if partition is not None else None
+
+            if entry is not None and entry[0] > time.monotonic():
+                partition.move_to_end(key)
+                self._partitions.move_to_end(tenant_id)
+                self._stats['hits'] += 1
+                return copy.deepcopy(entry[1])
+
+            self._stats['misses'] += 1
+            generation = self._generations.get(tenant_id, 0)
+
+        result = compute()
+
+        with self._lock:
+            # Tenant invalidated while computing: result may be stale
+            if self._generations.get(tenant_id, 0) == generation:
+                self._store(tenant_id, key, copy.deepcopy(result))
+
+        return result
+
+    def invalidate(self, tenant_id: str) -> int:
+        """
+        Drop all memoized results of a tenant
+
+        Results still being computed when invalidate() is called are
+        not stored.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            partition = self._partitions.pop(tenant_id, None)
+            return len(partition) if partition else 0
+
+    def get_stats(self) -> dict:
+        """Get memo cache statistics"""
+        with self._lock:
+            return {
+                **self._stats,
+                'tenants': len(self._partitions),
+                'entries': sum(len(p) for p in self._partitions.values()),
+            }
+
+    def get_interface_declaration(self) -> dict:
+        """
+        Declaration for the NORP-008 interface (norp_006_resource_pooling)
+
+        Returns:
+            Entry of 'cross_execution_caches'
+        """
+        return {
+            'name': 'node_memo',
+            'scope': 'tenant',
+            'key_strategy': 'tenant_prefixed_hash',
+            'node_types': self.pure_node_types,
+            'ttl_seconds': self.ttl_seconds,
+            'max_entries_per_tenant': self.max_entries_per_tenant,
+            'max_tenants': self.max_tenants,
+            'bypass_supported': True,
+        }
+
+    def _store(self, tenant_id: str, key: str, value: Any) -> None:
+        """Insert entry, sweep expired entries and enforce bounds (lock held)"""
+        now = time.monotonic()
+
+        if tenant_id not in self._partitions:
+            self._partitions[tenant_id] = OrderedDict()
+
+        partition = self._partitions[tenant_id]
+        self._partitions.move_to_end(tenant_id)
+
+        # 1. Sweep expired entries of this tenant
+        for expired_key in [k for k, (expires_at, _) in partition.items() if expires_at <= now]:
+            del partition[expired_key]
+            self._stats['expirations'] += 1
+
+        # 2. Insert (most recently used)
+        partition[key] = (now + self.ttl_seconds, value)
+        partition.move_to_end(key)
+
+        # 3. LRU eviction within tenant partition only
+        while len(partition) > self.max_entries_per_tenant:
+            partition.popitem(last=False)
+            self._stats['evictions'] += 1
+
+        # 4. Global bound: drop least recently used tenant partitions
+        while len(self._partitions) > self.max_tenants:
+            _, evicted = self._partitions.popitem(last=False)
+            self._stats['evictions'] += len(evicted)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _check_canonical(self, value: Any) -> None:
+        """
+        Ensure value only holds JSON-native types
+
+        Raises:
+            TypeError: On tuples, sets, non-string dict keys or other objects
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return
+
+        if isinstance(value, list):
+            for item in value:
+                self._check_canonical(item)
+            return
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise TypeError(f'Non-string key not canonical: {key!r}')
+                self._check_canonical(item)
+            return
+
+        raise TypeError(f'Type not canonical: {type(value).__name__}')
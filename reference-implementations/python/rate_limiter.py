@@ -0,0 +1,337 @@
+"""
+LlmRateLimiter - Per-server rate limiting for llm_call execution
+
+Implements:
+- Requests/second budget and AIMD concurrency per llm_server_id
+- Tokens/minute budget per (llm_server_id, model) (NORP-007 token estimation)
+- AIMD adaptive concurrency on throttling signals (HTTP 429),
+  decreased at most once per window
+- Queue-wait metrics per server and model
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class RatePermit:
+    """
+    Immutable permit returned by acquire() (NORP-003)
+
+    `generation` is the server AIMD generation at acquisition: throttles
+    reported for permits older than the last decrease are ignored.
+    """
+    server_key: Optional[str]
+    model_key: Optional[str]
+    generation: int
+    wait_seconds: float
+
+
+class TokenBucket:
+    """
+    Token bucket (refills continuously up to capacity)
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._available = capacity
+        self._updated_at = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        """
+        Seconds to wait before `amount` can be consumed
+
+        Requests larger than the bucket capacity are clamped to the
+        capacity, otherwise they could never be satisfied.
+        """
+        self._refill()
+        amount = min(amount, self.capacity)
+
+        if self._available >= amount:
+            return 0.0
+
+        return (amount - self._available) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Consume tokens (caller checked wait_time() first)"""
+        self._refill()
+        self._available -= min(amount, self.capacity)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._available = min(
+            self.capacity,
+            self._available + elapsed * self.refill_per_second
+        )
+
+
+class LlmRateLimiter:
+    """
+    Rate limiter for llm_call nodes
+
+    Providers throttle per llm_server_id: the requests/sec budget and the
+    AIMD concurrency limit are shared by all models of a server. Only the
+    tokens/min budget is kept per (llm_server_id, model), since providers
+    publish token quotas per model.
+
+    Usage (executor side):
+        permit = limiter.acquire(node)
+        try:
+            response = call_llm(node)
+            limiter.release(permit, status_code=response.status)
+        except Exception:
+            limiter.release(permit)
+            raise
+    """
+
+    DEFAULT_LIMITS = {
+        'requests_per_second': 5.0,
+        'tokens_per_minute': 90000,
+        'initial_concurrency': 4,
+        'max_concurrency': 16,
+    }
+
+    THROTTLE_STATUS_CODE = 429
+
+    def __init__(
+        self,
+        server_limits: Optional[Dict[Any, dict]] = None,
+        additive_increase: float = 1.0,
+        multiplicative_decrease: float = 0.5
+    ):
+        """
+        Args:
+            server_limits: Per llm_server_id overrides of DEFAULT_LIMITS
+                (ids are normalized with str(), so 1 and '1' are the same server)
+            additive_increase: Concurrency added per full window of successes
+            multiplicative_decrease: Concurrency factor applied on throttle
+        """
+        self.server_limits = {
+            self._server_key(server_id): limits
+            for server_id, limits in (server_limits or {}).items()
+        }
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+
+        self._condition = threading.Condition()
+        self._servers: Dict[str, dict] = {}
+        self._models: Dict[str, dict] = {}
+
+    def acquire(self, node: dict) -> RatePermit:
+        """
+        Block until the node may call its LLM server
+
+        Non llm_call nodes are never limited.
+
+        Args:
+            node: Node definition
+
+        Returns:
+            RatePermit (to pass to release())
+        """
+        if node.get('type') != 'llm_call':
+            return RatePermit(None, None, 0, 0.0)
+
+        server_key, model_key = self._get_keys(node)
+        tokens = self._estimate_tokens(node)
+        started_at = time.monotonic()
+
+        with self._condition:
+            server = self._get_server(server_key)
+            model = self._get_model(model_key, server)
+
+            while True:
+                # 1. Server concurrency slot (AIMD limit)
+                if server['in_flight'] >= int(server['concurrency']):
+                    self._condition.wait()
+                    continue
+
+                # 2. Server requests/sec and model tokens/min budgets
+                delay = max(
+                    server['requests'].wait_time(1),
+                    model['tokens'].wait_time(tokens)
+                )
+
+                if delay > 0:
+                    self._condition.wait(timeout=delay)
+                    continue
+
+                server['requests'].consume(1)
+                model['tokens'].consume(tokens)
+                server['in_flight'] += 1
+                break
+
+            waited = time.monotonic() - started_at
+            self._record_wait(server, waited)
+            self._record_wait(model, waited)
+
+            return RatePermit(server_key, model_key, server['generation'], waited)
+
+    def release(self, permit: RatePermit, status_code: Optional[int] = None) -> None:
+        """
+        Release the slot taken by acquire() and adapt concurrency (AIMD)
+
+        Args:
+            permit: Permit returned by acquire()
+            status_code: Provider response status (429 = throttled)
+        """
+        if permit.server_key is None:
+            return
+
+        with self._condition:
+            server = self._servers[permit.server_key]
+            server['in_flight'] = max(0, server['in_flight'] - 1)
+
+            if status_code == self.THROTTLE_STATUS_CODE:
+                server['throttled_count'] += 1
+                self._models[permit.model_key]['throttled_count'] += 1
+                self._decrease(server, permit.generation)
+            elif status_code is not None and status_code < 400:
+                self._increase(server)
+
+            self._condition.notify_all()
+
+    def get_metrics(self) -> Dict[str, dict]:
+        """
+        Get limiter metrics
+
+        Returns:
+            {'server_id': {'concurrency_limit': int, ..., 'models': {'model': {...}}}}
+        """
+        with self._condition:
+            metrics = {}
+
+            for server_key, server in sorted(self._servers.items()):
+                metrics[server_key] = {
+                    **self._wait_metrics(server),
+                    'in_flight': server['in_flight'],
+                    'concurrency_limit': int(server['concurrency']),
+                    'decreases': server['generation'],
+                    'models': {
+                        model['model']: self._wait_metrics(model)
+                        for _, model in sorted(self._models.items())
+                        if model['server'] is server
+                    },
+                }
+
+            return metrics
+
+    def _get_keys(self, node: dict) -> tuple:
+        """Limiter keys: ('server_id', 'server_id:model')"""
+        config = node.get('config', {})
+        server_key = self._server_key(config.get('llm_server_id'))
+        return server_key, f"{server_key}:{config.get('model', 'unknown')}"
+
+    def _server_key(self, server_id: Any) -> str:
+        """Normalized server key (missing id = 'default')"""
+        return 'default' if server_id is None else str(server_id)
+
+    def _get_server(self, server_key: str) -> dict:
+        """Get or lazily create server state (lock held)"""
+        if server_key not in self._servers:
+            limits = {**self.DEFAULT_LIMITS, **self.server_limits.get(server_key, {})}
+
+            self._servers[server_key] = {
+                'key': server_key,
+                'limits': limits,
+                # Capacity of at least one request: a sub-1 req/s budget
+                # must not be clamped (the clamp would let requests through
+                # faster than the configured rate)
+                'requests': TokenBucket(
+                    capacity=max(1.0, limits['requests_per_second']),
+                    refill_per_second=limits['requests_per_second']
+                ),
+                'concurrency': float(limits['initial_concurrency']),
+                'max_concurrency': limits['max_concurrency'],
+                'generation': 0,
+                'in_flight': 0,
+                **self._empty_wait_metrics(),
+            }
+
+        return self._servers[server_key]
+
+    def _get_model(self, model_key: str, server: dict) -> dict:
+        """Get or lazily create (server, model) state (lock held)"""
+        if model_key not in self._models:
+            tokens_per_minute = server['limits']['tokens_per_minute']
+
+            self._models[model_key] = {
+                'server': server,
+                'model': model_key[len(server['key']) + 1:],
+                'tokens': TokenBucket(
+                    capacity=tokens_per_minute,
+                    refill_per_second=tokens_per_minute / 60
+                ),
+                **self._empty_wait_metrics(),
+            }
+
+        return self._models[model_key]
+
+    def _estimate_tokens(self, node: dict) -> float:
+        """
+        Estimate tokens consumed by an llm_call (NORP-007)
+
+        Same approximation as cost estimation: chars / 4 for the prompt
+        plus max_tokens for the completion.
+        """
+        config = node.get('config', {})
+        input_tokens = len(config.get('prompt', '')) / 4
+        return input_tokens + config.get('max_tokens', 1000)
+
+    def _increase(self, server: dict) -> None:
+        """Additive increase: +additive_increase per window of successes"""
+        server['concurrency'] = min(
+            server['max_concurrency'],
+            server['concurrency'] + self.additive_increase / server['concurrency']
+        )
+
+    def _decrease(self, server: dict, generation: int) -> None:
+        """
+        Multiplicative decrease on throttle (never below 1)
+
+        Requests acquired before the last decrease belong to the window that
+        was already penalized: their 429s are ignored, so a burst of
+        simultaneous throttles decreases the limit only once.
+        """
+        if generation < server['generation']:
+            return
+
+        server['generation'] += 1
+        server['concurrency'] = max(
+            1.0,
+            server['concurrency'] * self.multiplicative_decrease
+        )
+
+    def _empty_wait_metrics(self) -> dict:
+        return {
+            'requests_count': 0,
+            'throttled_count': 0,
+            'wait_total': 0.0,
+            'wait_max': 0.0,
+        }
+
+    def _record_wait(self, state: dict, waited: float) -> None:
+        state['requests_count'] += 1
+        state['wait_total'] += waited
+        state['wait_max'] = max(state['wait_max'], waited)
+
+    def _wait_metrics(self, state: dict) -> dict:
+        requests = state['requests_count']
+
+        return {
+            'requests': requests,
+            'throttled': state['throttled_count'],
+            'queue_wait_total_ms': round(state['wait_total'] * 1000, 2),
+            'queue_wait_avg_ms': round(
+                state['wait_total'] * 1000 / requests, 2
+            ) if requests else 0.0,
+            'queue_wait_max_ms': round(state['wait_max'] * 1000, 2),
+        }
@@ -0,0 +1,11 @@
+"""
+Test configuration - makes the reference modules importable
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
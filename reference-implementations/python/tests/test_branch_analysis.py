@@ -0,0 +1,249 @@
+"""
+Tests for branch-aware plans (BranchAnalyzer, ExecutionPlan pruning, estimates)
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+from blueprint_compiler import BlueprintCompiler
+from blueprint_validator import BlueprintValidator
+from branch_analysis import BranchAnalyzer
+
+
+def node(node_id, depends_on=(), node_type='custom_code'):
+    return {'id': node_id, 'type': node_type, 'depends_on': list(depends_on)}
+
+
+def conditional(node_id, depends_on, branches):
+    return {
+        'id': node_id,
+        'type': 'conditional',
+        'config': {'branches': branches},
+        'depends_on': list(depends_on),
+    }
+
+
+def outcomes_of(plan, conditional_id):
+    return next(b for b in plan.branches if b['conditional'] == conditional_id)['outcomes']
+
+
+def diamond():
+    return {'nodes': [
+        node('extract', node_type='datasource'),
+        conditional('c', ['extract'], {'true': ['review'], 'false': ['pub']}),
+        node('review', ['c']),
+        node('pub', ['c']),
+        node('join', ['review', 'pub']),
+    ]}
+
+
+def test_join_after_both_branches_is_not_guarded():
+    plan = BlueprintCompiler().compile(diamond())
+
+    assert outcomes_of(plan, 'c') == {'false': ['pub'], 'true': ['review']}
+    assert plan.get_active_order({'c': 'false'}) == ['extract', 'c', 'pub', 'join']
+
+
+def test_upstream_dependency_does_not_keep_untaken_branch_alive():
+    workflow = diamond()
+    workflow['nodes'].append(node('z', ['review', 'extract']))
+
+    plan = BlueprintCompiler().compile(workflow)
+
+    assert outcomes_of(plan, 'c')['true'] == ['review', 'z']
+    assert plan.get_pruned_nodes({'c': 'false'}) == ['review', 'z']
+    assert 'z' not in plan.get_active_order({'c': 'false'})
+
+
+def test_undecided_conditionals_prune_nothing():
+    plan = BlueprintCompiler().compile(diamond())
+
+    assert plan.get_pruned_nodes({}) == []
+    assert plan.get_active_order({}) == plan.execution_order
+
+
+def nested():
+    return {'nodes': [
+        node('ext'),
+        conditional('c1', ['ext'], {'a': ['c2'], 'b': ['bb']}),
+        conditional('c2', ['c1'], {'t': ['x'], 'f': ['y']}),
+        node('bb', ['c1']),
+        node('x', ['c2', 'ext']),
+        node('y', ['c2']),
+    ]}
+
+
+def test_nested_guarded_sets_contain_inner_branches():
+    plan = BlueprintCompiler().compile(nested())
+
+    assert outcomes_of(plan, 'c1') == {'a': ['c2', 'x', 'y'], 'b': ['bb']}
+    assert outcomes_of(plan, 'c2') == {'f': ['y'], 't': ['x']}
+
+
+def test_pruned_conditional_prunes_all_its_entries():
+    plan = BlueprintCompiler().compile(nested())
+
+    assert plan.get_pruned_nodes({'c1': 'b'}) == ['c2', 'x', 'y']
+    assert plan.get_pruned_nodes({'c1': 'a', 'c2': 't'}) == ['bb', 'y']
+
+
+def nested_with_join():
+    workflow = nested()
+    workflow['nodes'].append(node('j', ['x', 'bb']))
+    return workflow
+
+
+def test_join_of_nested_branch_and_sibling_outcome_is_a_disjunction():
+    conditions = BranchAnalyzer().compute_conditions(nested_with_join()['nodes'])
+
+    assert conditions['x'] == {frozenset({('c1', 'a'), ('c2', 't')})}
+    assert conditions['j'] == {
+        frozenset({('c1', 'b')}),
+        frozenset({('c1', 'a'), ('c2', 't')}),
+    }
+
+
+def test_join_is_pruned_when_none_of_its_branches_is_taken():
+    plan = BlueprintCompiler().compile(nested_with_join())
+
+    assert plan.run_conditions['j'] == [[['c1', 'a'], ['c2', 't']], [['c1', 'b']]]
+    assert plan.get_pruned_nodes({'c1': 'a', 'c2': 'f'}) == ['bb', 'x', 'j']
+    assert plan.get_pruned_nodes({'c1': 'a', 'c2': 't'}) == ['bb', 'y']
+    assert plan.get_pruned_nodes({'c1': 'b'}) == ['c2', 'x', 'y']
+    # c2 not decided yet: j may still run through x
+    assert plan.get_pruned_nodes({'c1': 'a'}) == ['bb']
+
+
+def independent():
+    return {'nodes': [
+        conditional('c1', [], {'a': ['p'], 'b': ['q']}),
+        conditional('c2', [], {'a': ['r'], 'b': ['s']}),
+        node('p', ['c1']),
+        node('q', ['c1']),
+        node('r', ['c2']),
+        node('s', ['c2']),
+        node('n', ['p', 'r'], 'llm_call'),
+    ]}
+
+
+def test_node_needing_two_conditionals_requires_both():
+    workflow = independent()
+
+    plan = BlueprintCompiler().compile(workflow)
+
+    assert plan.run_conditions['n'] == [[['c1', 'a'], ['c2', 'a']]]
+    assert 'n' in plan.get_pruned_nodes({'c1': 'a', 'c2': 'b'})
+    assert 'n' not in plan.get_pruned_nodes({'c1': 'a', 'c2': 'a'})
+    # c1 5 + c2 5 + (p | q) 100 + (r | s) 100, plus n 2000 once in four
+    assert plan.duration_estimate == {'min': 210, 'max': 2210, 'expected': 710}
+
+
+def test_entry_shared_by_outcomes_always_runs():
+    workflow = {'nodes': [
+        conditional('c', [], {'a': ['s'], 'b': ['s']}),
+        node('s', ['c']),
+    ]}
+
+    plan = BlueprintCompiler().compile(workflow)
+
+    assert outcomes_of(plan, 'c') == {'a': [], 'b': []}
+    assert plan.get_pruned_nodes({'c': 'a'}) == []
+
+
+def test_duration_range_matches_pruning():
+    workflow = diamond()
+    workflow['nodes'].append(node('z', ['review', 'extract'], 'llm_call'))
+
+    plan = BlueprintCompiler().compile(workflow)
+
+    # extract 200 + c 5 + join 100, then review 100 + z 2000 or pub 100
+    assert plan.duration_estimate == {'min': 405, 'max': 2405, 'expected': 1405}
+    assert plan.estimated_duration_ms == 2405
+
+
+def test_nested_duration_range():
+    plan = BlueprintCompiler().compile(nested())
+
+    # ext 100 + c1 5; a: c2 5 + (x 100 | y 100); b: bb 100
+    assert plan.duration_estimate == {'min': 205, 'max': 210, 'expected': 208}
+
+
+def test_nested_join_duration_range():
+    plan = BlueprintCompiler().compile(nested_with_join())
+
+    # a/t (1/4): 210 + j 100; a/f (1/4): 210; b (1/2): 205 + j 100
+    assert plan.duration_estimate == {'min': 210, 'max': 310, 'expected': 282}
+
+
+def test_bounds_beyond_max_scenarios_keep_exact_expectation():
+    workflow = independent()
+    analyzer = BranchAnalyzer()
+    branches = analyzer.detect_branches(workflow['nodes'])
+    analyzer.MAX_SCENARIOS = 1
+
+    # min: c1 + c2; max: every node; expected: 2 + 4 * 1/2 + 1/4
+    estimate = analyzer.estimate_range(workflow['nodes'], branches, lambda n: 1)
+
+    assert estimate == {'min': 2, 'max': 7, 'expected': 4.25}
+
+
+def test_without_conditionals_estimate_is_the_sum():
+    workflow = {'nodes': [node('a', node_type='datasource'), node('b', ['a'], 'output')]}
+
+    plan = BlueprintCompiler().compile(workflow)
+
+    assert plan.duration_estimate == {'min': 250, 'max': 250, 'expected': 250}
+    assert plan.branches == []
+
+
+def test_cost_range_excludes_untaken_llm_calls():
+    workflow = diamond()
+    workflow['nodes'][2] = {
+        'id': 'review',
+        'type': 'llm_call',
+        'config': {'model': 'gpt-4-turbo', 'prompt': '', 'max_tokens': 1000},
+        'depends_on': ['c'],
+    }
+
+    result = BlueprintValidator().validate(workflow)
+
+    # 1000 / 1000 * 0.030 * 1.3 margin
+    assert result.cost_estimate == {'min': 0.0, 'max': 0.039, 'expected': 0.0195}
+    assert result.estimated_cost == 0.039
+
+
+def test_validator_reports_malformed_branches():
+    for branches in [['a'], 'a', None, {'true': 'approve'}]:
+        workflow = {'nodes': [conditional('c', [], branches), node('approve', ['c'])]}
+
+        result = BlueprintValidator().validate(workflow)
+
+        assert result.errors == [
+            "Conditional 'c' branches must map each outcome to a list of node IDs"
+        ]
+
+
+def test_validator_reports_invalid_entries():
+    workflow = {'nodes': [
+        conditional('c', [], {'true': ['missing', 'free']}),
+        node('free'),
+    ]}
+
+    result = BlueprintValidator().validate(workflow)
+
+    assert result.errors == [
+        "Conditional 'c' outcome 'true' references non-existent node 'missing'",
+        "Conditional 'c' outcome 'true' entry 'free' must depend on 'c'",
+    ]
+
+
+def test_cyclic_graph_does_not_break_estimation():
+    workflow = {'nodes': [
+        conditional('c', ['n'], {'x': ['n']}),
+        node('n', ['c']),
+    ]}
+
+    result = BlueprintValidator().validate(workflow)
+
+    assert 'Cycle detected in execution graph' in result.errors
+    assert result.cost_estimate == {'min': 0.0, 'max': 0.0, 'expected': 0.0}
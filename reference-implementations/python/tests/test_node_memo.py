@@ -0,0 +1,157 @@
+"""
+Tests for NodeMemoCache (tenant isolation, canonical keys, TTL and bounds)
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+import time
+
+import pytest
+
+from node_memo import NodeMemoCache
+
+
+DATASOURCE = {'id': 'extract', 'type': 'datasource', 'config': {'query': 'SELECT 1'}}
+
+
+def memo(**kwargs):
+    return NodeMemoCache(pure_node_types=['datasource', 'custom_code'], **kwargs)
+
+
+def test_same_tenant_reuses_result():
+    cache = memo()
+
+    assert cache.get_or_compute('acme', DATASOURCE, {'x': 1}, lambda: 'first') == 'first'
+    assert cache.get_or_compute('acme', DATASOURCE, {'x': 1}, lambda: 'second') == 'first'
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_tenants_never_share_results():
+    cache = memo()
+
+    cache.get_or_compute('acme', DATASOURCE, {'x': 1}, lambda: 'acme')
+
+    assert cache.get_or_compute('globex', DATASOURCE, {'x': 1}, lambda: 'globex') == 'globex'
+    assert cache.make_key('acme', DATASOURCE, {}).startswith('tenant:acme:node:')
+
+
+def test_tenant_id_is_required():
+    with pytest.raises(ValueError):
+        memo().get_or_compute('', DATASOURCE, {}, lambda: 1)
+
+
+@pytest.mark.parametrize('first, second', [
+    ({1: 'x'}, {'1': 'x'}),
+    ((1, 2), [1, 2]),
+    ({'k': (1,)}, {'k': [1]}),
+])
+def test_non_canonical_inputs_never_return_another_result(first, second):
+    cache = memo()
+
+    assert cache.get_or_compute('acme', DATASOURCE, {'v': first}, lambda: 'first') == 'first'
+    assert cache.get_or_compute('acme', DATASOURCE, {'v': second}, lambda: 'second') == 'second'
+
+
+def test_non_canonical_inputs_raise_in_make_key():
+    with pytest.raises(TypeError):
+        memo().make_key('acme', DATASOURCE, {1: 'x'})
+
+    with pytest.raises(TypeError):
+        memo().make_key('acme', DATASOURCE, {'v': object()})
+
+
+def test_key_ignores_node_id_and_dict_order():
+    cache = memo()
+    other = {'id': 'other', 'type': 'datasource', 'config': {'query': 'SELECT 1'}}
+
+    assert cache.make_key('acme', DATASOURCE, {'a': 1, 'b': 2}) == \
+        cache.make_key('acme', other, {'b': 2, 'a': 1})
+
+
+def test_bypass_and_not_memoizable_are_counted_separately():
+    cache = memo()
+
+    cache.get_or_compute('acme', DATASOURCE, {}, lambda: 1, bypass=True)
+    cache.get_or_compute('acme', {'type': 'llm_call'}, {}, lambda: 1)
+    cache.get_or_compute('acme', {'type': 'datasource', 'config': {'memoize': False}}, {}, lambda: 1)
+    cache.get_or_compute('acme', DATASOURCE, {'v': (1,)}, lambda: 1)
+
+    stats = cache.get_stats()
+    assert stats['bypassed'] == 1
+    assert stats['not_memoizable'] == 3
+    assert stats['entries'] == 0
+
+
+def test_cached_value_is_a_private_copy():
+    cache = memo()
+
+    result = cache.get_or_compute('acme', DATASOURCE, {}, lambda: {'rows': [1]})
+    result['rows'].append(2)
+
+    assert cache.get_or_compute('acme', DATASOURCE, {}, lambda: None) == {'rows': [1]}
+
+
+def test_entries_expire_and_are_swept_on_insert():
+    cache = memo(ttl_seconds=0.02)
+
+    cache.get_or_compute('acme', DATASOURCE, {'x': 1}, lambda: 'old')
+    time.sleep(0.03)
+
+    assert cache.get_or_compute('acme', DATASOURCE, {'x': 1}, lambda: 'new') == 'new'
+
+    cache.get_or_compute('acme', DATASOURCE, {'x': 2}, lambda: 'other')
+    time.sleep(0.03)
+    cache.get_or_compute('acme', DATASOURCE, {'x': 3}, lambda: 'fresh')
+
+    stats = cache.get_stats()
+    assert stats['entries'] == 1
+    assert stats['expirations'] == 3
+
+
+def test_per_tenant_lru_does_not_evict_other_tenants():
+    cache = memo(max_entries_per_tenant=2)
+
+    cache.get_or_compute('globex', DATASOURCE, {'x': 0}, lambda: 'globex')
+    for i in range(3):
+        cache.get_or_compute('acme', DATASOURCE, {'x': i}, lambda: i)
+
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 3
+    assert cache.get_or_compute('globex', DATASOURCE, {'x': 0}, lambda: 'miss') == 'globex'
+
+
+def test_tenant_partitions_are_globally_bounded():
+    cache = memo(max_tenants=2)
+
+    for tenant_id in ['a', 'b', 'c']:
+        cache.get_or_compute(tenant_id, DATASOURCE, {}, lambda: tenant_id)
+
+    stats = cache.get_stats()
+    assert stats['tenants'] == 2
+    assert cache.get_or_compute('a', DATASOURCE, {}, lambda: 'recomputed') == 'recomputed'
+
+
+def test_invalidate_and_interface_declaration():
+    cache = memo()
+    cache.get_or_compute('acme', DATASOURCE, {}, lambda: 1)
+
+    assert cache.invalidate('acme') == 1
+    assert cache.invalidate('acme') == 0
+
+    declaration = cache.get_interface_declaration()
+    assert declaration['scope'] == 'tenant'
+    assert declaration['node_types'] == ['custom_code', 'datasource']
+
+
+def test_invalidate_during_compute_discards_result():
+    cache = memo()
+
+    def compute():
+        cache.invalidate('acme')
+        return 'stale'
+
+    assert cache.get_or_compute('acme', DATASOURCE, {}, compute) == 'stale'
+    assert cache.get_or_compute('acme', DATASOURCE, {}, lambda: 'fresh') == 'fresh'
+    assert cache.get_or_compute('acme', DATASOURCE, {}, lambda: 'other') == 'fresh'
@@ -0,0 +1,213 @@
+"""
+Tests for LlmRateLimiter (per-server budgets, AIMD concurrency, metrics)
+
+License: MIT
+Copyright: 2026 NeuraScope CONVERWAY
+"""
+
+import threading
+import time
+
+from rate_limiter import LlmRateLimiter, RatePermit, TokenBucket
+
+
+def llm_node(server_id=1, model='gpt-4-turbo', prompt='', max_tokens=10):
+    return {
+        'id': f'{server_id}-{model}',
+        'type': 'llm_call',
+        'config': {
+            'llm_server_id': server_id,
+            'model': model,
+            'prompt': prompt,
+            'max_tokens': max_tokens,
+        },
+    }
+
+
+FAST = {'requests_per_second': 1000.0, 'tokens_per_minute': 10 ** 9}
+
+
+def test_non_llm_nodes_are_not_limited():
+    limiter = LlmRateLimiter()
+    permit = limiter.acquire({'id': 'x', 'type': 'datasource'})
+
+    assert permit == RatePermit(None, None, 0, 0.0)
+    limiter.release(permit, status_code=429)
+    assert limiter.get_metrics() == {}
+
+
+def test_concurrency_is_shared_across_models_of_a_server():
+    limiter = LlmRateLimiter(server_limits={1: {**FAST, 'initial_concurrency': 2}})
+    peak = {'current': 0, 'max': 0}
+    lock = threading.Lock()
+
+    def call(model):
+        permit = limiter.acquire(llm_node(model=model))
+        with lock:
+            peak['current'] += 1
+            peak['max'] = max(peak['max'], peak['current'])
+        time.sleep(0.02)
+        with lock:
+            peak['current'] -= 1
+        limiter.release(permit)
+
+    threads = [
+        threading.Thread(target=call, args=(model,))
+        for model in ['gpt-4-turbo', 'claude-3-haiku'] * 2
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak['max'] == 2
+
+
+def test_throttle_on_one_model_slows_the_whole_server():
+    limiter = LlmRateLimiter(server_limits={1: {**FAST, 'initial_concurrency': 4}})
+
+    permit = limiter.acquire(llm_node(model='claude-3-haiku'))
+    limiter.release(permit, status_code=429)
+
+    metrics = limiter.get_metrics()['1']
+    assert metrics['concurrency_limit'] == 2
+    assert metrics['throttled'] == 1
+    assert metrics['models']['claude-3-haiku']['throttled'] == 1
+
+
+def test_servers_are_independent():
+    limiter = LlmRateLimiter(server_limits={
+        1: {**FAST, 'initial_concurrency': 4},
+        2: {**FAST, 'initial_concurrency': 4},
+    })
+
+    limiter.release(limiter.acquire(llm_node(server_id=1)), status_code=429)
+    limiter.release(limiter.acquire(llm_node(server_id=2)), status_code=200)
+
+    metrics = limiter.get_metrics()
+    assert metrics['1']['concurrency_limit'] == 2
+    assert metrics['2']['concurrency_limit'] == 4
+
+
+def test_burst_of_throttles_decreases_once_per_window():
+    limiter = LlmRateLimiter(server_limits={1: {**FAST, 'initial_concurrency': 16}})
+
+    permits = [limiter.acquire(llm_node()) for _ in range(4)]
+    for permit in permits:
+        limiter.release(permit, status_code=429)
+
+    metrics = limiter.get_metrics()['1']
+    assert metrics['concurrency_limit'] == 8
+    assert metrics['decreases'] == 1
+    assert metrics['throttled'] == 4
+
+    # A request acquired after the decrease opens a new window
+    limiter.release(limiter.acquire(llm_node()), status_code=429)
+    assert limiter.get_metrics()['1']['concurrency_limit'] == 4
+
+
+def test_concurrency_never_drops_below_one():
+    limiter = LlmRateLimiter(server_limits={1: {**FAST, 'initial_concurrency': 2}})
+
+    for _ in range(5):
+        limiter.release(limiter.acquire(llm_node()), status_code=429)
+
+    assert limiter.get_metrics()['1']['concurrency_limit'] == 1
+
+
+def test_additive_increase_is_capped():
+    limiter = LlmRateLimiter(server_limits={
+        1: {**FAST, 'initial_concurrency': 2, 'max_concurrency': 3}
+    })
+
+    for _ in range(20):
+        limiter.release(limiter.acquire(llm_node()), status_code=200)
+
+    assert limiter.get_metrics()['1']['concurrency_limit'] == 3
+
+
+def test_release_without_status_keeps_concurrency():
+    limiter = LlmRateLimiter(server_limits={1: {**FAST, 'initial_concurrency': 3}})
+
+    limiter.release(limiter.acquire(llm_node()))
+    limiter.release(limiter.acquire(llm_node()), status_code=500)
+
+    metrics = limiter.get_metrics()['1']
+    assert metrics['concurrency_limit'] == 3
+    assert metrics['in_flight'] == 0
+
+
+def test_requests_per_second_is_shared_by_models_and_reports_queue_wait():
+    limiter = LlmRateLimiter(server_limits={
+        1: {'requests_per_second': 10.0, 'tokens_per_minute': 10 ** 9}
+    })
+
+    for model in ['a', 'b'] * 6:
+        limiter.release(limiter.acquire(llm_node(model=model)), status_code=200)
+
+    metrics = limiter.get_metrics()['1']
+    # 10 burst + 2 refilled at 10 req/s
+    assert metrics['requests'] == 12
+    assert metrics['queue_wait_total_ms'] >= 150
+    assert metrics['queue_wait_max_ms'] >= 80
+    assert metrics['models']['a']['requests'] == 6
+
+
+def test_tokens_per_minute_is_kept_per_model():
+    # Each call estimates 40 / 4 + 0 = 10 tokens out of a 15 tokens/min budget
+    limiter = LlmRateLimiter(server_limits={
+        1: {'requests_per_second': 1000.0, 'tokens_per_minute': 15}
+    })
+
+    for model in ['a', 'b']:
+        permit = limiter.acquire(llm_node(model=model, prompt='x' * 40, max_tokens=0))
+        assert permit.wait_seconds < 0.05
+        limiter.release(permit, status_code=200)
+
+    # Model 'a' budget is drained, yet 'b' was served without waiting
+    assert limiter._models['1:a']['tokens'].wait_time(10) > 0
+
+
+def test_sub_one_request_per_second_rate_is_respected():
+    # 0.5 req/s: 1 burst request, then one every 2 seconds
+    limiter = LlmRateLimiter(server_limits={
+        1: {'requests_per_second': 0.5, 'tokens_per_minute': 10 ** 9}
+    })
+
+    started_at = time.monotonic()
+    for _ in range(2):
+        limiter.release(limiter.acquire(llm_node()), status_code=200)
+
+    assert time.monotonic() - started_at >= 1.9
+
+
+def test_server_limits_keys_are_normalized():
+    limiter = LlmRateLimiter(server_limits={'1': {**FAST, 'initial_concurrency': 1}})
+
+    limiter.release(limiter.acquire(llm_node(server_id=1)))
+    limiter.release(limiter.acquire({**llm_node(), 'config': {
+        **llm_node()['config'], 'llm_server_id': '1'
+    }}))
+
+    metrics = limiter.get_metrics()
+    assert list(metrics) == ['1']
+    assert metrics['1']['concurrency_limit'] == 1
+    assert metrics['1']['requests'] == 2
+
+
+def test_missing_server_id_uses_default_limits_key():
+    limiter = LlmRateLimiter(server_limits={None: {**FAST, 'initial_concurrency': 3}})
+    node = llm_node()
+    del node['config']['llm_server_id']
+
+    limiter.release(limiter.acquire(node))
+
+    assert limiter.get_metrics()['default']['concurrency_limit'] == 3
+
+
+def test_token_bucket_clamps_oversized_requests():
+    bucket = TokenBucket(capacity=10, refill_per_second=1)
+
+    assert bucket.wait_time(50) == 0.0
+    bucket.consume(50)
+    assert bucket.wait_time(1) > 0.9
@@ -10,8 +10,8 @@ License: MIT
 Copyright: 2026 NeuraScope CONVERWAY
 """
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 
 @dataclass(frozen=True)
@@ -23,6 +23,7 @@ class ValidationResult:
     errors: List[str]
     warnings: List[str]
     estimated_cost: float = 0.0
+    cost_estimate: Dict[str, float] = field(default_factory=dict)
 
     def has_critical_errors(self) -> bool:
         """Check if critical errors are present"""
@@ -34,7 +35,8 @@ class ValidationResult:
             'valid': self.valid,
             'errors': self.errors,
             'warnings': self.warnings,
-            'estimated_cost': self.estimated_cost
+            'estimated_cost': self.estimated_cost,
+            'cost_estimate': self.cost_estimate
         }
 
     def get_summary(self) -> str: